@@ -11,15 +11,36 @@ from __future__ import annotations
 from importlib import import_module
 from typing import TYPE_CHECKING, Any
 
-__all__ = ["Trade", "load_trades", "calculate_realized_pnl", "summarize_realized_pnl"]
+__all__ = [
+    "Trade",
+    "TradeColumns",
+    "load_trades",
+    "load_trades_many",
+    "load_trade_columns",
+    "load_trades_table",
+    "calculate_realized_pnl",
+    "summarize_realized_pnl",
+]
 
 
 if TYPE_CHECKING:  # pragma: no cover - used only for static analysis
-    from .pnl_calculator import Trade, calculate_realized_pnl, load_trades, summarize_realized_pnl
+    from .pnl_calculator import (
+        Trade,
+        TradeColumns,
+        calculate_realized_pnl,
+        load_trade_columns,
+        load_trades,
+        load_trades_many,
+        load_trades_table,
+        summarize_realized_pnl,
+    )
 
 
 def __getattr__(name: str) -> Any:
     if name in __all__:
         module = import_module(".pnl_calculator", __name__)
-        return getattr(module, name)
+        value = getattr(module, name)
+        # Cache on the package so later lookups bypass ``__getattr__``.
+        globals()[name] = value
+        return value
     raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
@@ -3,6 +3,10 @@
 The module exposes a :class:`Trade` data class, helpers to load trades from a CSV
 file and a function to aggregate realized P&L optionally constrained to a time
 range.  A small CLI is also provided for ad-hoc usage.
+
+Trades are parsed with the standard library :mod:`csv` module.  When
+:mod:`pyarrow` is installed, :func:`load_trades_table` additionally loads an
+export into an Arrow table for vectorized aggregation.
 """
 from __future__ import annotations
 
@@ -10,21 +14,66 @@ import argparse
 import csv
 import logging
 import os
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from dataclasses import fields as dataclass_fields
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
+from itertools import compress, islice, repeat
+from operator import attrgetter, ge, itemgetter, le
 from pathlib import Path
-from typing import Iterable, Iterator, List, Optional
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+try:  # pragma: no cover - optional dependency
+    import pyarrow as pa
+    from pyarrow import compute as pc
+    from pyarrow import csv as pa_csv
+except ImportError:  # pragma: no cover - exercised when pyarrow is not installed
+    pa = None
+    pc = None
+    pa_csv = None
 
 _LOGGER = logging.getLogger(__name__)
+_CONFIGURED = False
 
 _DATE_FORMATS = (
     "%Y-%m-%d %H:%M:%S",
     "%Y-%m-%d",
 )
 
+# CSV columns in the same order as the :class:`Trade` fields they populate.
+_TRADE_COLUMNS = (
+    "Uid",
+    "Contracts",
+    "Trade Type",
+    "Qty",
+    "Entry Price",
+    "Realized P&L",
+    "Filled Price",
+    "Exit Type",
+    "Filled/Settlement Time(UTC+0)",
+    "Create Time",
+)
+_REQUIRED_COLUMNS = frozenset(_TRADE_COLUMNS)
+_DECIMAL_COLUMNS = ("Qty", "Entry Price", "Realized P&L", "Filled Price")
+_DATETIME_COLUMNS = ("Filled/Settlement Time(UTC+0)", "Create Time")
+_REALIZED_PNL_COLUMN = "Realized P&L"
+_FILLED_TIME_COLUMN = "Filled/Settlement Time(UTC+0)"
+
+_ARROW_BLOCK_SIZE = 1 << 20
+_READ_BUFFER_SIZE = 1 << 20
 
-@dataclass(frozen=True)
+# Exports repeat the same timestamps, quantities and prices across fills, so
+# parsed values are memoized.  Each cache is cleared once it grows past its
+# limit to bound memory on files with mostly unique values.
+_DATETIME_CACHE: dict[str, datetime] = {}
+_DATETIME_CACHE_LIMIT = 200_000
+_DEC_CACHE: dict[str, Decimal] = {}
+_DEC_CACHE_LIMIT = 100_000
+
+
+@dataclass(frozen=True, slots=True)
 class Trade:
     """Normalized representation of a single trade entry."""
 
@@ -39,8 +88,60 @@ class Trade:
     filled_time: datetime
     created_time: datetime
 
+    def __reduce__(self):
+        # Pickle as a constructor call.  The default frozen-dataclass state
+        # protocol restores every slot through ``object.__setattr__`` and is
+        # about twice as slow, which dominates :func:`load_trades_many`.
+        return (
+            type(self),
+            (
+                self.uid,
+                self.contract,
+                self.trade_type,
+                self.quantity,
+                self.entry_price,
+                self.realized_pnl,
+                self.filled_price,
+                self.exit_type,
+                self.filled_time,
+                self.created_time,
+            ),
+        )
+
+
+@dataclass(slots=True)
+class TradeColumns:
+    """Column-oriented representation of a list of trades.
+
+    Each attribute holds one list with an entry per trade, aligned by index and
+    named after the matching :class:`Trade` field.  Aggregations that only need
+    a couple of columns can then run over those lists without touching the
+    remaining fields.
+    """
+
+    uid: List[str]
+    contract: List[str]
+    trade_type: List[str]
+    quantity: List[Decimal]
+    entry_price: List[Decimal]
+    realized_pnl: List[Decimal]
+    filled_price: List[Decimal]
+    exit_type: List[str]
+    filled_time: List[datetime]
+    created_time: List[datetime]
+
+    @classmethod
+    def from_trades(cls, trades: Iterable[Trade]) -> "TradeColumns":
+        """Build columns from :class:`Trade` objects, preserving their order."""
+
+        trades = list(trades)
+        return cls(*(list(map(attrgetter(field.name), trades)) for field in dataclass_fields(cls)))
+
+    def __len__(self) -> int:
+        return len(self.uid)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class PnLSummary:
     """Aggregated view of realized P&L over a period."""
 
@@ -61,9 +162,14 @@ def configure_logging(log_level: Optional[str] = None) -> None:
         Optional textual level (e.g. ``"INFO"``). When omitted an environment
         variable ``BB_CALC_LOG_LEVEL`` is used.  ``logging.basicConfig`` is only
         invoked when no handlers are already configured to avoid clobbering
-        application level logging.
+        application level logging.  Only the first call has any effect.
     """
 
+    global _CONFIGURED
+    if _CONFIGURED:
+        return
+    _CONFIGURED = True
+
     if logging.getLogger().handlers:
         return
 
@@ -73,13 +179,42 @@ def configure_logging(log_level: Optional[str] = None) -> None:
 
 
 def _parse_decimal(value: str, column: str) -> Decimal:
-    try:
-        return Decimal(value)
-    except (InvalidOperation, ValueError) as exc:  # pragma: no cover - defensive branch
-        raise ValueError(f"Invalid decimal value '{value}' in column '{column}'") from exc
+    parsed = _DEC_CACHE.get(value)
+    if parsed is None:
+        try:
+            parsed = Decimal(value)
+        except (InvalidOperation, ValueError) as exc:  # pragma: no cover - defensive branch
+            raise ValueError(f"Invalid decimal value '{value}' in column '{column}'") from exc
+        if len(_DEC_CACHE) > _DEC_CACHE_LIMIT:
+            _DEC_CACHE.clear()
+        _DEC_CACHE[value] = parsed
+    return parsed
 
 
 def _parse_datetime(value: str, column: str) -> datetime:
+    parsed = _DATETIME_CACHE.get(value)
+    if parsed is None:
+        parsed = _parse_datetime_uncached(value, column)
+        if len(_DATETIME_CACHE) > _DATETIME_CACHE_LIMIT:
+            _DATETIME_CACHE.clear()
+        _DATETIME_CACHE[value] = parsed
+    return parsed
+
+
+def _parse_datetime_uncached(value: str, column: str) -> datetime:
+    # Slice the two supported layouts directly; ``strptime`` is only used for
+    # anything that does not look like ``YYYY-MM-DD[ HH:MM:SS]``.
+    fields: tuple[str, ...] = ()
+    if len(value) == 19 and value[10] == " " and value[13] == ":" and value[16] == ":":
+        fields = (value[0:4], value[5:7], value[8:10], value[11:13], value[14:16], value[17:19])
+    elif len(value) == 10:
+        fields = (value[0:4], value[5:7], value[8:10])
+    if fields and value[4] == "-" and value[7] == "-" and all(map(str.isdigit, fields)):
+        try:
+            return datetime(*map(int, fields))
+        except ValueError:
+            pass
+
     for fmt in _DATE_FORMATS:
         try:
             return datetime.strptime(value, fmt)
@@ -88,18 +223,34 @@ def _parse_datetime(value: str, column: str) -> datetime:
     raise ValueError(f"Unsupported datetime format '{value}' in column '{column}'")
 
 
-def _normalize_trade(row: dict) -> Trade:
+def _normalize_trade(fields: Sequence[str]) -> Trade:
+    """Build a :class:`Trade` from raw cells ordered like ``_TRADE_COLUMNS``."""
+
+    (
+        uid,
+        contract,
+        trade_type,
+        quantity,
+        entry_price,
+        realized_pnl,
+        filled_price,
+        exit_type,
+        filled_time,
+        created_time,
+    ) = fields
+    # Arguments are passed positionally (in ``Trade`` field order) because this
+    # runs once per row and keyword binding is a noticeable share of its cost.
     return Trade(
-        uid=row["Uid"],
-        contract=row["Contracts"],
-        trade_type=row["Trade Type"],
-        quantity=_parse_decimal(row["Qty"], "Qty"),
-        entry_price=_parse_decimal(row["Entry Price"], "Entry Price"),
-        realized_pnl=_parse_decimal(row["Realized P&L"], "Realized P&L"),
-        filled_price=_parse_decimal(row["Filled Price"], "Filled Price"),
-        exit_type=row["Exit Type"],
-        filled_time=_parse_datetime(row["Filled/Settlement Time(UTC+0)"], "Filled/Settlement Time(UTC+0)"),
-        created_time=_parse_datetime(row["Create Time"], "Create Time"),
+        uid,
+        contract,
+        trade_type,
+        _parse_decimal(quantity, "Qty"),
+        _parse_decimal(entry_price, "Entry Price"),
+        _parse_decimal(realized_pnl, "Realized P&L"),
+        _parse_decimal(filled_price, "Filled Price"),
+        exit_type,
+        _parse_datetime(filled_time, "Filled/Settlement Time(UTC+0)"),
+        _parse_datetime(created_time, "Create Time"),
     )
 
 
@@ -130,22 +281,176 @@ def load_trades(csv_path: Path, encoding: str = "utf-8") -> List[Trade]:
 
     _LOGGER.debug("Loading trades from %s", csv_path)
 
-    with csv_path.open("r", encoding=encoding, newline="") as handle:
-        lines = list(handle)
+    return _load_trades_csv(csv_path, encoding)
+
+
+def _load_trades_csv(csv_path: Path, encoding: str) -> List[Trade]:
+    """Load trades using the standard library :mod:`csv` module."""
 
-    header_index = _find_header_index(lines)
-    reader = csv.DictReader(lines[header_index:])
+    with csv_path.open("r", buffering=_READ_BUFFER_SIZE, encoding=encoding, newline="") as handle:
+        header_index, fieldnames = _read_header(handle)
 
-    if reader.fieldnames is None:  # pragma: no cover - csv module invariants
-        raise ValueError("CSV file is missing a header row")
+        missing_columns = _REQUIRED_COLUMNS - set(fieldnames)
+        if missing_columns:
+            raise ValueError(f"Missing required columns: {', '.join(sorted(missing_columns))}")
 
-    reader.fieldnames = [_clean_header_cell(name) for name in reader.fieldnames]
+        # Resolve column positions once so each row is picked apart with a single
+        # C-level itemgetter call instead of building a dict per row.
+        positions = {name: position for position, name in enumerate(fieldnames)}
+        pick_fields = itemgetter(*(positions[name] for name in _TRADE_COLUMNS))
 
-    missing_columns = {key for key in _required_columns() if key not in reader.fieldnames}
-    if missing_columns:
-        raise ValueError(f"Missing required columns: {', '.join(sorted(missing_columns))}")
+        reader = csv.reader(handle)
+        try:
+            return [_normalize_trade(pick_fields(row)) for row in reader if row]
+        except IndexError as exc:
+            line_number = header_index + 1 + reader.line_num
+            raise ValueError(f"Row on line {line_number} has fewer cells than the header") from exc
 
-    return [_normalize_trade(row) for row in reader]
+
+def load_trades_many(
+    csv_paths: Sequence[Path], encoding: str = "utf-8", max_workers: Optional[int] = None
+) -> List[Trade]:
+    """Load trades from several CSV files in parallel.
+
+    Parameters
+    ----------
+    csv_paths:
+        Paths to the CSV files to load.
+    encoding:
+        Character encoding shared by all files. Defaults to UTF-8.
+    max_workers:
+        Maximum number of concurrent workers.  Defaults to the number of CPUs,
+        capped at the number of files.
+
+    Returns
+    -------
+    list[Trade]
+        Trades of every file, file by file in the order of *csv_paths*.
+
+    Notes
+    -----
+    Each file is loaded with :func:`load_trades` in a worker process and the
+    resulting trades are pickled back to the calling process.  Unpickling them
+    there costs about two thirds as much as parsing them, so even with a spare
+    core per file the pool shortens the load by a third at most, and without
+    spare cores it is slower than a serial loop.  A single file, or a single
+    worker, is loaded serially without starting a pool.
+
+    The process pool uses the platform's default start method.  Where that is
+    ``spawn`` (macOS, Windows), scripts calling this function must guard their
+    entry point with ``if __name__ == "__main__":``.
+    """
+
+    paths = list(csv_paths)
+    if not paths:
+        return []
+
+    for csv_path in paths:
+        if not csv_path.exists():
+            raise FileNotFoundError(f"CSV file not found: {csv_path}")
+
+    workers = max_workers or min(len(paths), os.cpu_count() or 1)
+    _LOGGER.debug("Loading trades from %d files with %d workers", len(paths), workers)
+
+    if workers == 1 or len(paths) == 1:
+        return [trade for csv_path in paths for trade in load_trades(csv_path, encoding)]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        batches = list(executor.map(load_trades, paths, repeat(encoding)))
+    return [trade for batch in batches for trade in batch]
+
+
+def load_trade_columns(csv_path: Path, encoding: str = "utf-8") -> TradeColumns:
+    """Load trades from a CSV file into a :class:`TradeColumns` instance.
+
+    Accepts the same inputs as :func:`load_trades` and yields the same values.
+    """
+
+    if not csv_path.exists():
+        raise FileNotFoundError(f"CSV file not found: {csv_path}")
+
+    return TradeColumns.from_trades(_load_trades_csv(csv_path, encoding))
+
+
+def load_trades_table(csv_path: Path, encoding: str = "utf-8") -> "pa.Table":
+    """Load trades from a CSV file into a :class:`pyarrow.Table`.
+
+    The table holds one column per required CSV column, keyed by the original
+    header names.  Numeric columns are ``decimal128(38, 20)`` and timestamps are
+    ``timestamp[s]``, so values with more than 20 fractional digits are
+    rejected and decimals carry a fixed scale of 20.  It can be passed directly
+    to :func:`summarize_realized_pnl` and :func:`calculate_realized_pnl`, which
+    then aggregate with :mod:`pyarrow.compute` instead of iterating over
+    :class:`Trade` objects.  That sum is exact, while :class:`Trade` sequences
+    are added in the current :mod:`decimal` context, so totals beyond its
+    precision (28 digits by default) differ in their last digits.
+
+    Raises
+    ------
+    ImportError
+        If the optional :mod:`pyarrow` dependency is not installed.
+    ValueError
+        If a value does not fit the column types above.
+    """
+
+    if pa is None:
+        raise ImportError("load_trades_table requires the optional 'pyarrow' dependency")
+
+    if not csv_path.exists():
+        raise FileNotFoundError(f"CSV file not found: {csv_path}")
+
+    _LOGGER.debug("Loading trade table from %s", csv_path)
+
+    return _read_trades_table(csv_path, encoding)
+
+
+def _read_trades_table(csv_path: Path, encoding: str) -> "pa.Table":
+    """Read the trade columns of *csv_path* into an Arrow table.
+
+    The preamble and header row are consumed with the same detection logic as
+    the :mod:`csv` based loader; only the remaining body is handed to Arrow,
+    which converts numeric columns to ``decimal128`` and timestamps to
+    ``timestamp[s]`` itself.
+    """
+
+    # The body is re-encoded as UTF-8, the only encoding Arrow tokenizes
+    # directly, so any codec supported by ``open`` works here as well.
+    with csv_path.open("r", buffering=_READ_BUFFER_SIZE, encoding=encoding, newline="") as handle:
+        _, header = _read_header(handle)
+        body = handle.read().encode("utf-8")
+
+    column_types = {name: pa.string() for name in _TRADE_COLUMNS}
+    column_types.update({name: pa.decimal128(38, 20) for name in _DECIMAL_COLUMNS})
+    column_types.update({name: pa.timestamp("s") for name in _DATETIME_COLUMNS})
+
+    if not body.strip():
+        return pa.schema([(name, column_types[name]) for name in _TRADE_COLUMNS]).empty_table()
+
+    # Arrow selects the first of several equally named columns, while the csv
+    # loader (like csv.DictReader before it) uses the last one.  Rename the
+    # earlier duplicates so both loaders read the same cells.
+    last_position = {name: position for position, name in enumerate(header)}
+    column_names = [
+        name if last_position[name] == position else f"__duplicate_{position}"
+        for position, name in enumerate(header)
+    ]
+
+    table = pa_csv.read_csv(
+        pa.BufferReader(body),
+        read_options=pa_csv.ReadOptions(column_names=column_names, block_size=_ARROW_BLOCK_SIZE),
+        parse_options=pa_csv.ParseOptions(),
+        convert_options=pa_csv.ConvertOptions(
+            column_types=column_types,
+            include_columns=list(_TRADE_COLUMNS),
+            timestamp_parsers=list(_DATE_FORMATS),
+        ),
+    )
+
+    for name in _DECIMAL_COLUMNS + _DATETIME_COLUMNS:
+        if table.column(name).null_count:
+            raise ValueError(f"Missing value in column '{name}'")
+
+    return table
 
 
 def _clean_header_cell(value: str) -> str:
@@ -154,54 +459,47 @@ def _clean_header_cell(value: str) -> str:
     return value.strip().lstrip("\ufeff")
 
 
-def _find_header_index(lines: List[str]) -> int:
-    """Locate the CSV header row within the provided file contents."""
+def _parse_header_line(raw_line: str) -> Optional[List[str]]:
+    """Return the cleaned header cells when *raw_line* is the CSV header row."""
 
-    required = _required_columns()
+    # Every required name must appear verbatim in the header line, so a
+    # substring scan rules out preamble and data rows before tokenizing.
+    if not all(name in raw_line for name in _REQUIRED_COLUMNS):
+        return None
+
+    try:
+        row = next(csv.reader([raw_line]))
+    except csv.Error:  # pragma: no cover - defensive branch
+        return None
+
+    cells = [_clean_header_cell(cell) for cell in row]
+    if _REQUIRED_COLUMNS.issubset(cells):
+        return cells
+    return None
 
-    for index, raw_line in enumerate(lines):
-        try:
-            row = next(csv.reader([raw_line]))
-        except csv.Error:  # pragma: no cover - defensive branch
-            continue
 
-        cleaned_cells = {_clean_header_cell(cell) for cell in row if cell}
-        if required.issubset(cleaned_cells):
-            return index
+def _read_header(lines: Iterator[str]) -> Tuple[int, List[str]]:
+    """Consume *lines* up to and including the CSV header row.
+
+    Returns the zero-based line index of the header together with its cleaned
+    cells.  The iterator is left positioned on the first data row so callers
+    can keep streaming the body from it.
+    """
+
+    for index, raw_line in enumerate(lines):
+        header = _parse_header_line(raw_line)
+        if header is not None:
+            return index, header
 
     raise ValueError(
         "Unable to locate header row containing required columns in CSV file"
     )
 
 
-def _required_columns() -> set[str]:
-    return {
-        "Uid",
-        "Contracts",
-        "Trade Type",
-        "Qty",
-        "Entry Price",
-        "Realized P&L",
-        "Filled Price",
-        "Exit Type",
-        "Filled/Settlement Time(UTC+0)",
-        "Create Time",
-    }
-
-
-def _filter_trades(
-    trades: Iterable[Trade], start: Optional[datetime], end: Optional[datetime]
-) -> Iterator[Trade]:
-    for trade in trades:
-        if start and trade.filled_time < start:
-            continue
-        if end and trade.filled_time > end:
-            continue
-        yield trade
-
-
 def calculate_realized_pnl(
-    trades: Iterable[Trade], start: Optional[datetime] = None, end: Optional[datetime] = None
+    trades: Union[Iterable[Trade], TradeColumns, "pa.Table"],
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
 ) -> Decimal:
     """Aggregate realized P&L for the provided trades.
 
@@ -223,25 +521,61 @@ def calculate_realized_pnl(
 
 
 def summarize_realized_pnl(
-    trades: Iterable[Trade], start: Optional[datetime] = None, end: Optional[datetime] = None
+    trades: Union[Iterable[Trade], TradeColumns, "pa.Table"],
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
 ) -> PnLSummary:
-    """Compute aggregated statistics for realized P&L within an optional period."""
+    """Compute aggregated statistics for realized P&L within an optional period.
+
+    *trades* may be an iterable of :class:`Trade` objects, a
+    :class:`TradeColumns` instance or a table returned by
+    :func:`load_trades_table`.
+    """
 
     if start and end and start > end:
         raise ValueError("start datetime must be earlier than or equal to end datetime")
 
+    if isinstance(trades, TradeColumns):
+        return _summarize_realized_pnl_columns(trades.filled_time, trades.realized_pnl, start, end)
+    if pa is not None and isinstance(trades, pa.Table):
+        return _summarize_realized_pnl_arrow(trades, start, end)
+
     total = Decimal("0")
     trade_count = 0
     earliest: Optional[datetime] = None
     latest: Optional[datetime] = None
 
-    for trade in _filter_trades(trades, start, end):
-        total += trade.realized_pnl
-        trade_count += 1
-        if earliest is None or trade.filled_time < earliest:
-            earliest = trade.filled_time
-        if latest is None or trade.filled_time > latest:
-            latest = trade.filled_time
+    if start is None and end is None:
+        # Nothing to filter: seed the fill bounds from the first trade so the
+        # loop body needs neither period checks nor ``None`` tests.
+        remaining = iter(trades)
+        first = next(remaining, None)
+        if first is not None:
+            total += first.realized_pnl
+            trade_count = 1
+            earliest = latest = first.filled_time
+            for trade in remaining:
+                filled_time = trade.filled_time
+                total += trade.realized_pnl
+                trade_count += 1
+                if filled_time < earliest:
+                    earliest = filled_time
+                elif filled_time > latest:
+                    latest = filled_time
+    else:
+        # Open bounds become sentinels so each trade needs a single chained check.
+        lower = start or datetime.min
+        upper = end or datetime.max
+        for trade in trades:
+            filled_time = trade.filled_time
+            if filled_time < lower or filled_time > upper:
+                continue
+            total += trade.realized_pnl
+            trade_count += 1
+            if earliest is None or filled_time < earliest:
+                earliest = filled_time
+            if latest is None or filled_time > latest:
+                latest = filled_time
 
     return PnLSummary(
         total=total,
@@ -253,6 +587,98 @@ def summarize_realized_pnl(
     )
 
 
+def _summarize_realized_pnl_columns(
+    filled_times: Sequence[datetime],
+    realized: Sequence[Decimal],
+    start: Optional[datetime],
+    end: Optional[datetime],
+) -> PnLSummary:
+    """Aggregate aligned fill time and realized P&L columns.
+
+    Time-ordered columns are narrowed to the requested period with binary
+    search; unordered ones fall back to a mask over every fill time.  The
+    reductions themselves use the builtin ``sum``/``min``/``max``.
+    """
+
+    if start or end:
+        window = _time_ordered_window(filled_times, start, end)
+        if window is not None:
+            lo, hi = window
+            filled_times = filled_times[lo:hi]
+            realized = realized[lo:hi]
+        else:
+            lower = start or datetime.min
+            upper = end or datetime.max
+            mask = [lower <= filled_time <= upper for filled_time in filled_times]
+            filled_times = list(compress(filled_times, mask))
+            realized = list(compress(realized, mask))
+
+    return PnLSummary(
+        total=sum(realized, Decimal("0")),
+        trade_count=len(filled_times),
+        start=start,
+        end=end,
+        earliest_fill=min(filled_times, default=None),
+        latest_fill=max(filled_times, default=None),
+    )
+
+
+def _time_ordered_window(
+    filled_times: Sequence[datetime], start: Optional[datetime], end: Optional[datetime]
+) -> Optional[Tuple[int, int]]:
+    """Return the ``[lo, hi)`` index range of fills within the inclusive period.
+
+    Exports are usually sorted newest first, so both ascending and descending
+    orders are supported.  ``None`` is returned when *filled_times* is not
+    ordered and the caller has to inspect every value.
+    """
+
+    if all(map(le, filled_times, islice(filled_times, 1, None))):
+        ascending = filled_times
+    elif all(map(ge, filled_times, islice(filled_times, 1, None))):
+        ascending = filled_times[::-1]
+    else:
+        return None
+
+    lo = bisect_left(ascending, start) if start else 0
+    hi = bisect_right(ascending, end) if end else len(ascending)
+    if ascending is filled_times:
+        return lo, hi
+    return len(ascending) - hi, len(ascending) - lo
+
+
+def _summarize_realized_pnl_arrow(
+    table: "pa.Table", start: Optional[datetime], end: Optional[datetime]
+) -> PnLSummary:
+    """Aggregate a trade table with vectorized :mod:`pyarrow.compute` kernels."""
+
+    filled_time = table[_FILLED_TIME_COLUMN]
+    mask = None
+    if start:
+        mask = pc.greater_equal(filled_time, pa.scalar(start))
+    if end:
+        upper = pc.less_equal(filled_time, pa.scalar(end))
+        mask = upper if mask is None else pc.and_(mask, upper)
+    if mask is not None:
+        table = table.filter(mask)
+
+    # Widen before summing: ``pc.sum`` keeps the input precision and silently
+    # wraps around once a decimal128(38, 20) total needs more than 38 digits.
+    # The result is exact and is not rounded to the ``decimal`` context.
+    realized = table[_REALIZED_PNL_COLUMN].cast(pa.decimal256(76, 20))
+    total = pc.sum(realized).as_py()
+    bounds = pc.min_max(table[_FILLED_TIME_COLUMN]).as_py()
+
+    return PnLSummary(
+        total=Decimal("0") if total is None else total,
+        trade_count=table.num_rows,
+        start=start,
+        end=end,
+        earliest_fill=bounds["min"],
+        latest_fill=bounds["max"],
+    )
+
+
 def _cli(argv: Optional[list[str]] = None) -> int:
     parser = argparse.ArgumentParser(description="Summarize realized P&L from a trade CSV export")
     parser.add_argument("csv", type=Path, help="Path to the CSV file")
@@ -1,17 +1,33 @@
 from __future__ import annotations
 
+import pickle
 from datetime import datetime
 from decimal import Decimal
 from pathlib import Path
 
 import pytest
 
-from bb_calc import calculate_realized_pnl, load_trades, summarize_realized_pnl
-from bb_calc.pnl_calculator import _cli
+from bb_calc import (
+    TradeColumns,
+    calculate_realized_pnl,
+    load_trade_columns,
+    load_trades,
+    load_trades_many,
+    summarize_realized_pnl,
+)
+from bb_calc import pnl_calculator
+from bb_calc.pnl_calculator import _cli, _parse_datetime
 
 
 FIXTURE_PATH = Path(__file__).parent / "data" / "sample_trades.csv"
 
+PERIODS = [
+    (None, None),
+    (datetime(2025, 7, 18), datetime(2025, 7, 18, 23, 59, 59)),
+    (datetime(2025, 7, 18, 7), None),
+    (None, datetime(2025, 7, 1)),
+]
+
 
 def test_load_trades_parses_expected_rows():
     trades = load_trades(FIXTURE_PATH)
@@ -23,6 +39,147 @@ def test_load_trades_parses_expected_rows():
     assert first.realized_pnl == Decimal("217.92480262000000000000")
 
 
+def _replace(old, new):
+    return lambda line: line.replace(old, new)
+
+
+def _write_fixture(tmp_path, edits=None, rows=None, encoding="utf-8", name="trades.csv"):
+    """Write the first *rows* fixture lines with ``edits`` applied by line index."""
+    lines = FIXTURE_PATH.read_text(encoding="utf-8").splitlines()[:rows]
+    for index, edit in (edits or {}).items():
+        lines[index] = edit(lines[index])
+    csv_path = tmp_path / name
+    csv_path.write_text("\n".join(lines) + "\n", encoding=encoding)
+    return csv_path
+
+
+@pytest.mark.parametrize(
+    "edits, encoding, field, expected",
+    [
+        (None, "utf-8", "quantity", "0.50000000000000000000"),
+        ({2: _replace("0.50000000000000000000", "0.5")}, "utf-8", "quantity", "0.5"),
+        (
+            {2: _replace("217.92480262000000000000", "217.9248026200000000000000001")},
+            "utf-8",
+            "realized_pnl",
+            "217.9248026200000000000000001",
+        ),
+        ({3: lambda line: line + ",unexpected"}, "utf-8", "quantity", "0.50000000000000000000"),
+        (None, "utf-16", "quantity", "0.50000000000000000000"),
+    ],
+    ids=["fixture", "short_scale", "long_scale", "extra_cell", "utf16"],
+)
+def test_load_trades_keeps_exported_values(tmp_path, edits, encoding, field, expected):
+    csv_path = _write_fixture(tmp_path, edits, encoding=encoding)
+
+    trades = load_trades(csv_path, encoding=encoding)
+
+    assert len(trades) == 9
+    assert str(getattr(trades[0], field)) == expected
+    assert load_trade_columns(csv_path, encoding=encoding) == TradeColumns.from_trades(trades)
+
+
+def test_load_trades_reports_invalid_decimal(tmp_path):
+    csv_path = _write_fixture(tmp_path, {2: _replace("0.50000000000000000000", "abc")})
+
+    with pytest.raises(ValueError, match="Invalid decimal value 'abc' in column 'Qty'"):
+        load_trades(csv_path)
+
+
+def test_load_trades_table_rejects_missing_values(tmp_path):
+    pytest.importorskip("pyarrow")
+    from bb_calc import load_trades_table
+
+    csv_path = _write_fixture(tmp_path, {2: _replace("217.92480262000000000000", "")})
+
+    with pytest.raises(ValueError, match="Realized P&L"):
+        load_trades_table(csv_path)
+
+
+def test_duplicate_header_columns_use_the_last_one(tmp_path):
+    edits = {index: lambda line: line + ",1" for index in range(2, 11)}
+    edits[1] = lambda line: line + ",Realized P&L"
+    csv_path = _write_fixture(tmp_path, edits)
+
+    trades = load_trades(csv_path)
+
+    assert {trade.realized_pnl for trade in trades} == {Decimal("1")}
+    pyarrow = pytest.importorskip("pyarrow")
+    from bb_calc import load_trades_table
+
+    table = load_trades_table(csv_path)
+    assert table.num_rows == 9
+    assert summarize_realized_pnl(table).total == Decimal("9")
+    assert pyarrow.types.is_decimal(table.schema.field("Realized P&L").type)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("2025-07-18 06:34:26", datetime(2025, 7, 18, 6, 34, 26)),
+        ("2025-07-18", datetime(2025, 7, 18)),
+        ("2025-7-18", datetime(2025, 7, 18)),
+    ],
+)
+def test_parse_datetime_supported_formats(value, expected):
+    assert _parse_datetime(value, "Create Time") == expected
+    assert _parse_datetime(value, "Create Time") == expected
+
+
+@pytest.mark.parametrize("value", ["2025-07-18T06:34:26", "2025-13-01", "2025-07-18 24:00:00"])
+def test_parse_datetime_rejects_invalid_values(value):
+    with pytest.raises(ValueError, match="Create Time"):
+        _parse_datetime(value, "Create Time")
+
+
+def test_load_trades_many_concatenates_in_order(tmp_path):
+    trades = load_trades(FIXTURE_PATH)
+    partial_path = _write_fixture(tmp_path, rows=4, name="partial.csv")
+
+    loaded = load_trades_many([partial_path, FIXTURE_PATH], max_workers=2)
+
+    assert loaded == trades[:2] + trades
+    assert load_trades_many([]) == []
+
+
+def test_load_trades_many_single_worker_skips_pools(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("no executor expected")
+
+    monkeypatch.setattr(pnl_calculator, "ProcessPoolExecutor", fail)
+    trades = load_trades(FIXTURE_PATH)
+
+    assert load_trades_many([FIXTURE_PATH]) == trades
+    assert load_trades_many([FIXTURE_PATH, FIXTURE_PATH], max_workers=1) == trades + trades
+
+
+def test_trade_pickles_round_trip():
+    trades = load_trades(FIXTURE_PATH)
+
+    restored = pickle.loads(pickle.dumps(trades))
+
+    assert restored == trades
+    assert [str(trade.quantity) for trade in restored] == [str(trade.quantity) for trade in trades]
+
+
+def test_trade_columns_from_trades_round_trip():
+    trades = load_trades(FIXTURE_PATH)
+
+    columns = TradeColumns.from_trades(trades)
+
+    assert columns == load_trade_columns(FIXTURE_PATH)
+    assert columns.uid[0] == "382647166"
+    assert columns.realized_pnl == [trade.realized_pnl for trade in trades]
+
+
+def test_load_trades_without_pyarrow_rejects_short_rows(monkeypatch, tmp_path):
+    csv_path = _write_fixture(tmp_path, {3: lambda line: line.rsplit(",", 1)[0]})
+    monkeypatch.setattr(pnl_calculator, "pa", None)
+
+    with pytest.raises(ValueError, match="line 4"):
+        load_trades(csv_path)
+
+
 def test_calculate_realized_pnl_full_range():
     trades = load_trades(FIXTURE_PATH)
 
@@ -65,6 +222,124 @@ def test_summarize_realized_pnl():
     assert summary.latest_fill == datetime(2025, 7, 18, 7, 33, 23)
 
 
+@pytest.mark.parametrize("start, end", PERIODS)
+def test_summarize_realized_pnl_columns_matches_trades(start, end):
+    columns = load_trade_columns(FIXTURE_PATH)
+
+    summary = summarize_realized_pnl(columns, start=start, end=end)
+
+    assert len(columns) == 9
+    assert summary == summarize_realized_pnl(load_trades(FIXTURE_PATH), start=start, end=end)
+
+
+@pytest.mark.parametrize("start, end", PERIODS)
+def test_summarize_realized_pnl_list_uses_trade_loop(monkeypatch, start, end):
+    trades = load_trades(FIXTURE_PATH)
+    expected = summarize_realized_pnl(TradeColumns.from_trades(trades), start=start, end=end)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("column aggregation not expected for Trade lists")
+
+    monkeypatch.setattr(pnl_calculator, "_summarize_realized_pnl_columns", fail)
+
+    assert summarize_realized_pnl(trades, start=start, end=end) == expected
+
+
+def test_summarize_realized_pnl_without_trades():
+    summary = summarize_realized_pnl(iter([]))
+
+    assert summary.total == Decimal("0")
+    assert summary.trade_count == 0
+    assert summary.earliest_fill is None
+    assert summary.latest_fill is None
+
+
+@pytest.mark.parametrize("start, end", PERIODS)
+@pytest.mark.parametrize("order", ["descending", "ascending", "unordered"])
+def test_summarize_realized_pnl_independent_of_order(order, start, end):
+    trades = load_trades(FIXTURE_PATH)
+    expected = summarize_realized_pnl(iter(trades), start=start, end=end)
+    if order == "ascending":
+        trades.reverse()
+    elif order == "unordered":
+        trades = trades[1::2] + trades[::2]
+
+    assert summarize_realized_pnl(trades, start=start, end=end) == expected
+    columns = TradeColumns.from_trades(trades)
+    assert summarize_realized_pnl(columns, start=start, end=end) == expected
+
+
+@pytest.mark.parametrize("start, end", PERIODS)
+def test_summarize_realized_pnl_table_matches_trades(start, end):
+    pytest.importorskip("pyarrow")
+    from bb_calc import load_trades_table
+
+    table = load_trades_table(FIXTURE_PATH)
+
+    summary = summarize_realized_pnl(table, start=start, end=end)
+
+    assert summary == summarize_realized_pnl(load_trades(FIXTURE_PATH), start=start, end=end)
+
+
+def test_package_caches_lazy_exports():
+    import bb_calc
+
+    assert bb_calc.load_trades is pnl_calculator.load_trades
+    assert vars(bb_calc)["load_trades"] is pnl_calculator.load_trades
+
+
+def test_summarize_realized_pnl_table_does_not_overflow(tmp_path):
+    pytest.importorskip("pyarrow")
+    from bb_calc import load_trades_table
+
+    edits = {
+        2: _replace("217.92480262000000000000", "900000000000000000"),
+        3: _replace("2234.45326650000000000000", "900000000000000000"),
+    }
+    csv_path = _write_fixture(tmp_path, edits, rows=4)
+
+    summary = summarize_realized_pnl(load_trades_table(csv_path))
+
+    assert summary.total == Decimal("1800000000000000000")
+    assert summary.total == summarize_realized_pnl(load_trades(csv_path)).total
+
+
+def test_summarize_realized_pnl_table_sums_exactly(tmp_path):
+    pytest.importorskip("pyarrow")
+    from bb_calc import load_trades_table
+
+    value = "123456789.12345678901234567891"
+    edits = {
+        2: _replace("217.92480262000000000000", value),
+        3: _replace("2234.45326650000000000000", value),
+    }
+    csv_path = _write_fixture(tmp_path, edits, rows=4)
+
+    table_total = summarize_realized_pnl(load_trades_table(csv_path)).total
+    trade_total = summarize_realized_pnl(load_trades(csv_path)).total
+
+    assert table_total == Decimal("246913578.24691357802469135782")
+    assert trade_total == Decimal("246913578.2469135780246913578")
+    assert summarize_realized_pnl(load_trade_columns(csv_path)).total == trade_total
+
+
+@pytest.mark.parametrize("use_pyarrow", [True, False])
+def test_cli_output_independent_of_pyarrow(monkeypatch, capsys, tmp_path, use_pyarrow):
+    edits = {
+        2: _replace("217.92480262000000000000", "19.5"),
+        3: _replace("2234.45326650000000000000", "199.50"),
+    }
+    csv_path = _write_fixture(tmp_path, edits, rows=4)
+    if use_pyarrow:
+        pytest.importorskip("pyarrow")
+    else:
+        monkeypatch.setattr(pnl_calculator, "pa", None)
+
+    assert _cli([str(csv_path)]) == 0
+
+    assert capsys.readouterr().out.splitlines()[2].endswith(": 219.00")
+
+
 def test_cli_outputs_summary(capsys):
     exit_code = _cli([str(FIXTURE_PATH), "--start", "2025-07-18", "--end", "2025-07-18 23:59:59"])
 